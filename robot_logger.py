@@ -1,5 +1,6 @@
 import os
-from datetime import datetime
+import sys
+import time
 
 
 class RobotLogger:
@@ -24,12 +25,43 @@ class RobotLogger:
         self.use_colors = self._supports_color()
         self.test_name = None
         self.step_num = 0
+        self._time_cache = (-1, "")
+
+    @property
+    def use_colors(self):
+        """Whether to use colors in the output."""
+        return self._use_colors
+
+    @use_colors.setter
+    def use_colors(self, value):
+        self._use_colors = value
+        self._level_tags = {
+            level: self._color(f"[{level}]", color)
+            for level, color in (
+                ("INFO", self.BLUE),
+                ("PASS", self.GREEN),
+                ("FAIL", self.RED),
+                ("ERROR", self.RED + self.BOLD),
+                ("WARNING", self.YELLOW),
+            )
+        }
+        self._separator_line = self._color("─" * 40, self.CYAN)
+
+    @property
+    def test_name(self):
+        """The name of the current test, or None outside a test."""
+        return self._test_name
+
+    @test_name.setter
+    def test_name(self, value):
+        self._test_name = value
+        self._test_part = f" | {value}" if value else ""
 
     def _supports_color(self):
         """Check if the terminal supports colors."""
         return (
-            hasattr(os.sys.stdout, "isatty")
-            and os.sys.stdout.isatty()
+            hasattr(sys.stdout, "isatty")
+            and sys.stdout.isatty()
             and os.environ.get("TERM") != "dumb"
             and os.environ.get("NO_COLOR") is None
         )
@@ -38,55 +70,59 @@ class RobotLogger:
         """Add color to the text."""
         return f"{color}{text}{self.RESET}" if self.use_colors else text
 
-    def _log(self, level, message, color):
+    def _timestamp(self, _time=time.time, _localtime=time.localtime):
+        """Return the current HH:MM:SS, reusing it within the same second."""
+        sec = int(_time())
+        if sec != self._time_cache[0]:
+            lt = _localtime(sec)
+            self._time_cache = (sec, f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}")
+        return self._time_cache[1]
+
+    def _log(self, level, message):
         """Log a message."""
-        time = datetime.now().strftime("%H:%M:%S")
-        level_str = self._color(f"[{level}]", color)
-        test_part = f" | {self.test_name}" if self.test_name else ""
-        print(f"{time} {level_str}{test_part} | {message}")
+        ts = self._timestamp()
+        sys.stdout.write(f"{ts} {self._level_tags[level]}{self._test_part} | {message}\n")
 
     def start_test(self, test_name):
         """Start a new test."""
         self.test_name = test_name
         self.step_num = 0
-        print(f"\n{self._color('─' * 40, self.CYAN)}")
-        print(self._color(f"🚀 {test_name}", self.CYAN + self.BOLD))
-        print(f"{self._color('─' * 40, self.CYAN)}")
+        header = self._color(f"🚀 {test_name}", self.CYAN + self.BOLD)
+        sys.stdout.write(f"\n{self._separator_line}\n{header}\n{self._separator_line}\n")
 
     def end_test(self, result):
         """End the current test."""
         icon = "✅" if result == "PASS" else "❌"
         color = self.GREEN if result == "PASS" else self.RED
-        print(f"\n{self._color('─' * 40, self.CYAN)}")
-        print(self._color(f"{icon} {self.test_name}: {result}", color + self.BOLD))
-        print(f"{self._color('─' * 40, self.CYAN)}\n")
+        summary = self._color(f"{icon} {self.test_name}: {result}", color + self.BOLD)
+        sys.stdout.write(f"\n{self._separator_line}\n{summary}\n{self._separator_line}\n\n")
         self.test_name = None
         self.step_num = 0
 
     def step(self, message):
         """Log a test step."""
         self.step_num += 1
-        self._log("INFO", f"Step {self.step_num}: {message}", self.BLUE)
+        self._log("INFO", f"Step {self.step_num}: {message}")
 
     def info(self, message):
         """Log info message."""
-        self._log("INFO", message, self.BLUE)
+        self._log("INFO", message)
 
     def pass_test(self, message):
         """Log test pass."""
-        self._log("PASS", message, self.GREEN)
+        self._log("PASS", message)
 
     def fail(self, message):
         """Log test fail."""
-        self._log("FAIL", message, self.RED)
+        self._log("FAIL", message)
 
     def error(self, message):
         """Log error."""
-        self._log("ERROR", message, self.RED + self.BOLD)
+        self._log("ERROR", message)
 
     def warning(self, message):
         """Log warning."""
-        self._log("WARNING", message, self.YELLOW)
+        self._log("WARNING", message)
 
 
 # Usage example
@@ -3,38 +3,48 @@
 Simple script to run Robot Framework tests with custom logger
 """
 
+import shutil
 import subprocess
 import sys
 import os
 
 
-def run_robot_tests():
-    """Run Robot Framework tests."""
+ROBOT_COMMAND = [
+    "robot",
+    "--outputdir",
+    "results",
+    "--log",
+    "log.html",
+    "--report",
+    "report.html",
+    "test_suite.robot",
+]
+
+
+def run_robot_tests(replace_process=False):
+    """Run Robot Framework tests.
+
+    If replace_process is True, exec robot in place of this process
+    and skip the summary output.
+    """
 
     # Check if robot is installed
-    try:
-        subprocess.run(["robot", "--version"], check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if shutil.which("robot") is None:
         print("❌ Robot Framework not found!")
         print("Install it with: pip install robotframework")
         return False
 
+    if replace_process:
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        os.execvp(ROBOT_COMMAND[0], ROBOT_COMMAND)
+
     # Run the test suite
     print("🚀 Running Robot Framework tests with custom logger...")
     print("=" * 60)
 
     try:
         result = subprocess.run(
-            [
-                "robot",
-                "--outputdir",
-                "results",
-                "--log",
-                "log.html",
-                "--report",
-                "report.html",
-                "test_suite.robot",
-            ],
+            ROBOT_COMMAND,
             cwd=os.path.dirname(os.path.abspath(__file__)),
         )
 
@@ -55,5 +65,5 @@ def run_robot_tests():
 
 
 if __name__ == "__main__":
-    success = run_robot_tests()
+    success = run_robot_tests(replace_process="--exec" in sys.argv[1:])
     sys.exit(0 if success else 1)